@@ -1,13 +1,19 @@
-from setuptools import setup, find_packages
+from setuptools import setup
 
 setup(
     name="chunk-learner",
     version="0.1.0",
-    packages=find_packages(where="src"),
+    packages=["chunk_learner"],
     package_dir={"": "src"},
     install_requires=[
-        "typer[all]>=0.12.0",
+        # typer-slim is typer without the rich/shellingham extras;
+        # rich is declared explicitly since the CLI renders tables
+        "typer-slim>=0.12.0",
+        "rich>=13.0.0",
     ],
+    extras_require={
+        "completion": ["shellingham>=1.5.0"],
+    },
     entry_points={
         "console_scripts": [
             "chunk-learner=chunk_learner.cli:app",
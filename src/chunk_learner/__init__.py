@@ -1,3 +1,19 @@
 """Chunk Learner - A learning task management system."""
 
+import importlib
+
 __version__ = "0.1.0"
+
+# Submodules loaded lazily (PEP 562) so importing the package doesn't pull
+# in sqlite3/datetime until a submodule is actually used.
+_SUBMODULES = ("cli", "database", "models", "operations")
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_SUBMODULES))
@@ -1,176 +1,309 @@
 """CLI interface for chunk learner."""
 
-import typer
-from rich.console import Console
-from rich.table import Table
+import functools
+from pathlib import Path
 from typing import Optional
-from . import database, operations
 
-app = typer.Typer(help="Chunk Learner - Manage your learning journey in bite-sized pieces")
-console = Console()
+import typer
+
+app = typer.Typer(
+    help="Chunk Learner - Manage your learning journey in bite-sized pieces",
+    add_completion=False,
+    no_args_is_help=True,
+)
+
+# Precomputed table cell strings so the list loop doesn't rebuild
+# markup and star strings per row
+_STARS = ("", "★", "★★", "★★★", "★★★★", "★★★★★")
+_STATUS = {True: "[green]✓ Complete[/green]", False: "[white]○ Incomplete[/white]"}
+
+
+def _stars(difficulty: int) -> str:
+    """Difficulty as a star string; out-of-range values are clamped."""
+    return _STARS[min(max(difficulty, 0), 5)]
+
+
+@functools.lru_cache(maxsize=1)
+def _console():
+    """Get the shared Rich console, importing Rich on first use.
+
+    Deferring the import keeps `--help` and argument errors from paying
+    the Rich startup cost.
+    """
+    from rich.console import Console
+
+    return Console()
 
 
 @app.command()
 def init():
     """Initialize the database."""
+    from . import database
+
+    console = _console()
+
     if database.database_exists():
         console.print("[yellow]Database already exists![/yellow]")
         return
-    
+
     database.init_database()
     console.print("[green]✓[/green] Database initialized successfully!")
     console.print(f"Database location: {database.DB_PATH}")
 
 
 @app.command()
-def add():
-    """Add a new learning chunk interactively."""
+def add(
+    name: Optional[str] = typer.Option(None, help="Chunk name"),
+    description: Optional[str] = typer.Option(None, help="Detailed description"),
+    difficulty: Optional[int] = typer.Option(None, help="Difficulty (1-5)"),
+    deps: Optional[str] = typer.Option(None, help="Comma-separated dependency chunk IDs"),
+):
+    """Add a new learning chunk.
+
+    Any value not supplied as an option is prompted for, so scripts can
+    pass everything on the command line and skip the prompts entirely.
+    """
+    from . import database, operations
+
+    console = _console()
+
     if not database.database_exists():
         console.print("[red]Error:[/red] Database not initialized. Run 'chunk-learner init' first.")
         raise typer.Exit(1)
-    
-    console.print("\n[bold]Create a new learning chunk[/bold]\n")
-    
-    name = typer.prompt("Chunk name")
-    description = typer.prompt("Description")
-    difficulty = typer.prompt("Difficulty (1-5)", type=int)
-    
+
+    interactive = name is None or description is None or difficulty is None
+
+    if interactive:
+        console.print("\n[bold]Create a new learning chunk[/bold]\n")
+
+    if name is None:
+        name = typer.prompt("Chunk name")
+    if description is None:
+        description = typer.prompt("Description")
+    if difficulty is None:
+        difficulty = typer.prompt("Difficulty (1-5)", type=int)
+
     # Validate difficulty
     if difficulty < 1 or difficulty > 5:
         console.print("[red]Error:[/red] Difficulty must be between 1 and 5")
         raise typer.Exit(1)
-    
+
     chunk_id = operations.create_chunk(name, description, difficulty)
     console.print(f"\n[green]✓[/green] Created chunk #{chunk_id}: {name}")
-    
-    # Ask about dependencies
-    add_deps = typer.confirm("\nDoes this chunk depend on any other chunks?", default=False)
-    
-    if add_deps:
-        # Show available chunks
-        chunks = operations.get_all_chunks()
-        if len(chunks) <= 1:  # Only the one we just created
-            console.print("[yellow]No other chunks available yet![/yellow]")
-        else:
-            console.print("\n[bold]Available chunks:[/bold]")
-            for chunk in chunks:
-                if chunk.id != chunk_id:
-                    console.print(f"  {chunk.id}: {chunk.name}")
-            
-            dep_ids = typer.prompt("\nEnter dependency chunk IDs (comma-separated)", default="")
-            if dep_ids:
-                for dep_id_str in dep_ids.split(","):
-                    try:
-                        dep_id = int(dep_id_str.strip())
-                        if operations.add_dependency(chunk_id, dep_id):
-                            console.print(f"[green]✓[/green] Added dependency on chunk #{dep_id}")
-                        else:
-                            console.print(f"[red]✗[/red] Failed to add dependency on chunk #{dep_id}")
-                    except ValueError:
-                        console.print(f"[red]✗[/red] Invalid chunk ID: {dep_id_str}")
 
+    dep_ids_input = deps
 
-@app.command()
-def list():
+    # Without a --deps option, fall back to the interactive flow
+    if dep_ids_input is None and interactive:
+        add_deps = typer.confirm("\nDoes this chunk depend on any other chunks?", default=False)
+
+        if add_deps:
+            # Show available chunks
+            chunks = operations.get_all_chunks()
+            if len(chunks) <= 1:  # Only the one we just created
+                console.print("[yellow]No other chunks available yet![/yellow]")
+            else:
+                console.print("\n[bold]Available chunks:[/bold]")
+                for chunk in chunks:
+                    if chunk.id != chunk_id:
+                        console.print(f"  {chunk.id}: {chunk.name}")
+
+                dep_ids_input = typer.prompt("\nEnter dependency chunk IDs (comma-separated)", default="")
+
+    if dep_ids_input:
+        # Parse everything first, then insert in one transaction
+        dep_ids = []
+        for dep_id_str in dep_ids_input.split(","):
+            try:
+                dep_ids.append(int(dep_id_str.strip()))
+            except ValueError:
+                console.print(f"[red]✗[/red] Invalid chunk ID: {dep_id_str}")
+
+        added = operations.add_dependencies(chunk_id, dep_ids)
+        for dep_id in dep_ids:
+            if dep_id in added:
+                console.print(f"[green]✓[/green] Added dependency on chunk #{dep_id}")
+            else:
+                console.print(f"[red]✗[/red] Failed to add dependency on chunk #{dep_id}")
+
+
+@app.command("import")
+def import_chunks(path: Path = typer.Argument(..., help="JSON file of chunks to import")):
+    """Import chunks from a JSON file in a single transaction.
+
+    The file holds a list of objects with "name", "description", and
+    "difficulty" keys, plus an optional "deps" list naming other entries
+    in the same file that the chunk depends on.
+    """
+    import json
+
+    from . import database, operations
+
+    console = _console()
+
+    if not database.database_exists():
+        console.print("[red]Error:[/red] Database not initialized. Run 'chunk-learner init' first.")
+        raise typer.Exit(1)
+
+    try:
+        entries = json.loads(path.read_text())
+    except (OSError, ValueError) as exc:
+        console.print(f"[red]Error:[/red] Could not read {path}: {exc}")
+        raise typer.Exit(1)
+
+    if not isinstance(entries, list):
+        console.print(f"[red]Error:[/red] {path} must contain a JSON list of chunk objects")
+        raise typer.Exit(1)
+
+    for entry in entries:
+        if not isinstance(entry, dict) or not isinstance(entry.get("name"), str):
+            console.print(f"[red]Error:[/red] Each entry must be an object with a \"name\": {entry!r}")
+            raise typer.Exit(1)
+        difficulty = entry.get("difficulty")
+        if not isinstance(difficulty, int) or not 1 <= difficulty <= 5:
+            console.print(f"[red]Error:[/red] Difficulty must be between 1 and 5: {entry['name']}")
+            raise typer.Exit(1)
+        dep_names = entry.get("deps", [])
+        if not isinstance(dep_names, list) or not all(isinstance(n, str) for n in dep_names):
+            console.print(f"[red]Error:[/red] \"deps\" must be a list of chunk names: {entry['name']}")
+            raise typer.Exit(1)
+
+    # Dependencies reference other entries in the file by name; a name
+    # that doesn't resolve is an error, not a silent drop
+    index_by_name = {e["name"]: i for i, e in enumerate(entries)}
+    for entry in entries:
+        for dep_name in entry.get("deps", []):
+            if dep_name not in index_by_name:
+                console.print(f"[red]Error:[/red] Unknown dependency \"{dep_name}\" for chunk: {entry['name']}")
+                raise typer.Exit(1)
+
+    rows = [(e["name"], e.get("description", ""), e["difficulty"]) for e in entries]
+
+    # Resolve names to row indices so everything lands in one transaction
+    deps = {}
+    for i, entry in enumerate(entries):
+        dep_idxs = [index_by_name[n] for n in entry.get("deps", [])]
+        if dep_idxs:
+            deps[i] = dep_idxs
+
+    chunk_ids = operations.create_chunks_bulk(rows, deps)
+
+    console.print(f"[green]✓[/green] Imported {len(chunk_ids)} chunks from {path}")
+
+
+@app.command("list")
+def list_chunks():
     """List all learning chunks."""
+    from rich.table import Table
+
+    from . import database, operations
+
+    console = _console()
+
     if not database.database_exists():
         console.print("[red]Error:[/red] Database not initialized. Run 'chunk-learner init' first.")
         raise typer.Exit(1)
-    
-    chunks = operations.get_all_chunks()
-    
+
+    chunks, dep_map = operations.get_all_chunks_with_deps()
+
     if not chunks:
         console.print("[yellow]No chunks yet! Use 'chunk-learner add' to create one.[/yellow]")
         return
-    
+
     table = Table(title="Learning Chunks")
     table.add_column("ID", style="cyan")
     table.add_column("Name", style="bold")
     table.add_column("Difficulty", style="yellow")
     table.add_column("Status", style="green")
     table.add_column("Dependencies")
-    
+
     for chunk in chunks:
-        status = "✓ Complete" if chunk.completed else "○ Incomplete"
-        status_style = "green" if chunk.completed else "white"
-        
-        # Get dependencies
-        deps = operations.get_chunk_dependencies(chunk.id)
-        dep_text = ", ".join([f"#{d.id}" for d in deps]) if deps else "-"
-        
+        dep_ids = dep_map.get(chunk.id)
+        dep_text = ", ".join(f"#{d}" for d in dep_ids) if dep_ids else "-"
+
         table.add_row(
             str(chunk.id),
             chunk.name,
-            "★" * chunk.difficulty,
-            f"[{status_style}]{status}[/{status_style}]",
+            _stars(chunk.difficulty),
+            _STATUS[chunk.completed],
             dep_text
         )
-    
+
     console.print(table)
 
 
 @app.command()
 def complete(chunk_id: int):
     """Mark a chunk as completed.
-    
+
     Args:
         chunk_id: ID of the chunk to complete
     """
+    from . import database, operations
+
+    console = _console()
+
     if not database.database_exists():
         console.print("[red]Error:[/red] Database not initialized. Run 'chunk-learner init' first.")
         raise typer.Exit(1)
-    
-    chunk = operations.get_chunk_by_id(chunk_id)
-    
-    if not chunk:
+
+    result = operations.try_complete_chunk(chunk_id)
+
+    if result is None:
         console.print(f"[red]Error:[/red] Chunk #{chunk_id} not found")
         raise typer.Exit(1)
-    
-    if chunk.completed:
+
+    name, already_completed, incomplete_deps = result
+
+    if already_completed:
         console.print(f"[yellow]Chunk #{chunk_id} is already completed![/yellow]")
         return
-    
-    # Check if dependencies are met
-    deps = operations.get_chunk_dependencies(chunk_id)
-    incomplete_deps = [d for d in deps if not d.completed]
-    
+
     if incomplete_deps:
         console.print(f"[red]Error:[/red] Cannot complete chunk #{chunk_id}. Incomplete dependencies:")
         for dep in incomplete_deps:
             console.print(f"  - #{dep.id}: {dep.name}")
         raise typer.Exit(1)
-    
-    if operations.complete_chunk(chunk_id):
-        console.print(f"[green]✓[/green] Completed chunk #{chunk_id}: {chunk.name}")
-    else:
-        console.print(f"[red]Error:[/red] Failed to complete chunk #{chunk_id}")
+
+    console.print(f"[green]✓[/green] Completed chunk #{chunk_id}: {name}")
 
 
 @app.command()
 def next():
     """Show the next chunk you should work on."""
+    from . import database, operations
+
+    console = _console()
+
     if not database.database_exists():
         console.print("[red]Error:[/red] Database not initialized. Run 'chunk-learner init' first.")
         raise typer.Exit(1)
-    
-    chunk = operations.get_next_available_chunk()
-    
+
+    chunk, deps = operations.get_next_chunk_with_deps()
+
     if not chunk:
         console.print("[green]🎉 No chunks available! Either you're done or all chunks are blocked by dependencies.[/green]")
         return
-    
+
     console.print("\n[bold]Next chunk to work on:[/bold]\n")
     console.print(f"[cyan]#{chunk.id}[/cyan] [bold]{chunk.name}[/bold]")
-    console.print(f"Difficulty: {'★' * chunk.difficulty}")
+    console.print(f"Difficulty: {_stars(chunk.difficulty)}")
     console.print(f"\n{chunk.description}\n")
-    
+
     # Show dependencies if any
-    deps = operations.get_chunk_dependencies(chunk.id)
     if deps:
         console.print("[dim]Dependencies (all completed):[/dim]")
         for dep in deps:
             console.print(f"  [green]✓[/green] #{dep.id}: {dep.name}")
 
+    # Other unblocked chunks are independent of each other, so they can
+    # be worked on alongside the suggested one
+    others = [c for c in operations.get_next_available_chunks() if c.id != chunk.id]
+    if others:
+        console.print("\n[dim]Also available — you can work on these in parallel:[/dim]")
+        for other in others:
+            console.print(f"  [cyan]#{other.id}[/cyan] {other.name} ({_stars(other.difficulty)})")
+
 
 if __name__ == "__main__":
     app()
@@ -1,25 +1,87 @@
 """Database setup and connection management."""
 
+import atexit
 import sqlite3
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
+
+
+# Bound once at module level: the converter runs per non-NULL timestamp
+# cell, so skip the datetime attribute lookup on every call
+_fromiso = datetime.fromisoformat
+
+
+def _convert_timestamp(value: bytes) -> Optional[datetime]:
+    """Convert a stored TIMESTAMP column value to a datetime."""
+    return _fromiso(value.decode()) if value else None
+
+
+# With PARSE_DECLTYPES, sqlite3 runs this converter per row at the C
+# layer, so TIMESTAMP columns come back as datetime objects and callers
+# no longer parse ISO strings themselves.
+sqlite3.register_converter("TIMESTAMP", _convert_timestamp)
 
 
 # Database file location
 DB_PATH = Path(__file__).parent.parent.parent / "data" / "chunk_learner.db"
 
+# Connection tuning: WAL cuts per-write fsyncs (one instead of two) and
+# allows concurrent readers; synchronous=NORMAL is durable enough for WAL.
+# journal_mode persists in the database file but is idempotent to re-issue.
+_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=134217728;
+    PRAGMA cache_size=-8000;
+    PRAGMA foreign_keys=ON;
+"""
+
+
+# Connections cached per database path: the CLI is a short-lived single
+# process, so reusing one connection keeps SQLite's prepared-statement
+# cache warm and skips per-call open/PRAGMA overhead. Callers must not
+# close the returned connection; it is closed at interpreter exit.
+_connections: Dict[str, sqlite3.Connection] = {}
+
 
 def get_connection() -> sqlite3.Connection:
-    """Get a database connection.
-    
+    """Get the shared database connection for the current DB_PATH.
+
     Returns:
         sqlite3.Connection: Database connection with row factory enabled
+        and performance PRAGMAs applied
     """
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row  # This lets us access columns by name
+    key = str(DB_PATH)
+    conn = _connections.get(key)
+    if conn is None:
+        conn = sqlite3.connect(
+            DB_PATH, detect_types=sqlite3.PARSE_DECLTYPES, check_same_thread=False
+        )
+        conn.row_factory = sqlite3.Row  # This lets us access columns by name
+        conn.executescript(_PRAGMAS)
+        _connections[key] = conn
     return conn
 
 
+@atexit.register
+def _close_connections() -> None:
+    """Close any cached connections at interpreter exit.
+
+    PRAGMA optimize runs first so the query planner's statistics stay
+    fresh as the database grows; it's a no-op when nothing changed.
+    Best-effort — a database removed mid-process shouldn't break exit.
+    """
+    while _connections:
+        _, conn = _connections.popitem()
+        try:
+            conn.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass
+        conn.close()
+
+
 def init_database() -> None:
     """Initialize the database with required tables.
     
@@ -52,9 +114,25 @@ def init_database() -> None:
             UNIQUE(chunk_id, depends_on_chunk_id)
         )
     """)
-    
+
+    # Indexes matching the query shapes in operations: dependency lookups
+    # by chunk and by target, and the "next available chunk" scan. The
+    # partial index covers ORDER BY difficulty, created_at over pending
+    # chunks so that query needs no sort.
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_dep_chunk
+        ON dependencies(chunk_id, depends_on_chunk_id)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_dep_target
+        ON dependencies(depends_on_chunk_id)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_chunks_pending
+        ON chunks(difficulty, created_at) WHERE completed = 0
+    """)
+
     conn.commit()
-    conn.close()
 
 
 def database_exists() -> bool:
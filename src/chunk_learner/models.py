@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Chunk:
     """Represents a learning chunk/task."""
     
@@ -16,12 +16,3 @@ class Chunk:
     completed: bool = False
     created_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
-
-
-@dataclass
-class Dependency:
-    """Represents a dependency between two chunks."""
-    
-    id: Optional[int] = None
-    chunk_id: int = 0
-    depends_on_chunk_id: int = 0
@@ -1,222 +1,483 @@
 """Business logic operations for chunk management."""
 
 import sqlite3
-from datetime import datetime
-from typing import List, Optional
+from collections import defaultdict
+from typing import Dict, Final, Iterator, List, Optional, Tuple
 from .database import get_connection
-from .models import Chunk, Dependency
+from .models import Chunk
+
+
+# SQL hoisted to module level so every call reuses the same statement
+# text; with the shared connection this keeps SQLite's per-connection
+# prepared-statement cache warm across calls.
+_SQL_INSERT_CHUNK: Final[str] = """
+    INSERT INTO chunks (name, description, difficulty) VALUES (?, ?, ?)
+"""
+
+_SQL_SELECT_ALL: Final[str] = """
+    SELECT * FROM chunks ORDER BY created_at DESC
+"""
+
+_SQL_SELECT_BY_ID: Final[str] = """
+    SELECT * FROM chunks WHERE id = ?
+"""
+
+_SQL_COMPLETE: Final[str] = """
+    UPDATE chunks SET completed = 1, completed_at = CURRENT_TIMESTAMP WHERE id = ?
+"""
+
+_SQL_COMPLETE_GUARDED: Final[str] = """
+    UPDATE chunks
+    SET completed = 1, completed_at = CURRENT_TIMESTAMP
+    WHERE id = ? AND completed = 0
+    AND NOT EXISTS (
+        SELECT 1 FROM dependencies d
+        JOIN chunks dep ON d.depends_on_chunk_id = dep.id
+        WHERE d.chunk_id = chunks.id AND dep.completed = 0
+    )
+    RETURNING name
+"""
+
+_SQL_INSERT_DEP: Final[str] = """
+    INSERT OR IGNORE INTO dependencies (chunk_id, depends_on_chunk_id) VALUES (?, ?)
+"""
+
+_SQL_WOULD_CYCLE: Final[str] = """
+    WITH RECURSIVE reach(id) AS (
+        SELECT ?
+        UNION
+        SELECT d.depends_on_chunk_id FROM dependencies d
+        JOIN reach r ON d.chunk_id = r.id
+    )
+    SELECT 1 FROM reach WHERE id = ? LIMIT 1
+"""
+
+_SQL_SELECT_DEPS: Final[str] = """
+    SELECT c.* FROM chunks c
+    JOIN dependencies d ON c.id = d.depends_on_chunk_id
+    WHERE d.chunk_id = ?
+"""
+
+_SQL_SELECT_ALL_WITH_DEPS: Final[str] = """
+    SELECT c.*, d.depends_on_chunk_id AS dep_id
+    FROM chunks c
+    LEFT JOIN dependencies d ON d.chunk_id = c.id
+    ORDER BY c.created_at DESC
+"""
+
+_SQL_AVAILABLE: Final[str] = """
+    SELECT c.* FROM chunks c
+    WHERE c.completed = 0
+    AND NOT EXISTS (
+        SELECT 1 FROM dependencies d
+        JOIN chunks dep ON d.depends_on_chunk_id = dep.id
+        WHERE d.chunk_id = c.id AND dep.completed = 0
+    )
+    ORDER BY c.difficulty ASC, c.created_at ASC
+"""
+
+_SQL_NEXT: Final[str] = _SQL_AVAILABLE + "    LIMIT 1"
+
+_SQL_AVAILABLE_BATCH: Final[str] = _SQL_AVAILABLE + "    LIMIT ?"
+
+_SQL_NEXT_WITH_DEPS: Final[str] = f"""
+    WITH picked AS ({_SQL_NEXT})
+    SELECT p.*, dep.id AS dep_id, dep.name AS dep_name,
+           dep.difficulty AS dep_difficulty, dep.completed AS dep_completed
+    FROM picked p
+    LEFT JOIN dependencies d ON d.chunk_id = p.id
+    LEFT JOIN chunks dep ON dep.id = d.depends_on_chunk_id
+"""
+
+
+def _row_to_chunk(row: sqlite3.Row) -> Chunk:
+    """Convert a chunks table row into a Chunk.
+
+    Timestamp columns arrive as datetime objects via the TIMESTAMP
+    converter registered in database.
+
+    Args:
+        row: A row selected from the chunks table
+
+    Returns:
+        Chunk: The materialized chunk
+    """
+    return Chunk(
+        id=row["id"],
+        name=row["name"],
+        description=row["description"],
+        difficulty=row["difficulty"],
+        completed=bool(row["completed"]),
+        created_at=row["created_at"],
+        completed_at=row["completed_at"]
+    )
 
 
 def create_chunk(name: str, description: str, difficulty: int) -> int:
     """Create a new learning chunk.
-    
+
     Args:
         name: Name of the chunk
         description: Detailed description
         difficulty: Difficulty level (1-5)
-        
+
     Returns:
         int: ID of the created chunk
     """
     conn = get_connection()
     cursor = conn.cursor()
-    
-    cursor.execute(
-        "INSERT INTO chunks (name, description, difficulty) VALUES (?, ?, ?)",
-        (name, description, difficulty)
-    )
-    
+
+    cursor.execute(_SQL_INSERT_CHUNK, (name, description, difficulty))
+
     chunk_id = cursor.lastrowid
     conn.commit()
-    conn.close()
-    
+
     return chunk_id
 
 
+def iter_all_chunks() -> Iterator[Chunk]:
+    """Iterate over all chunks without materializing the full list.
+
+    Rows are fetched in batches as the cursor is consumed, so memory
+    stays flat no matter how many chunks exist.
+
+    Yields:
+        Chunk: Each chunk, newest first
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.arraysize = 200  # Fetch in batches at the C layer
+
+    cursor.execute(_SQL_SELECT_ALL)
+    for row in cursor:
+        yield _row_to_chunk(row)
+
+
+def create_chunks_bulk(
+    rows: List[Tuple[str, str, int]],
+    deps: Optional[Dict[int, List[int]]] = None,
+) -> List[int]:
+    """Create several chunks, and optionally their dependencies, in a
+    single transaction.
+
+    One commit covers every insert, so bulk imports pay one fsync
+    instead of one per chunk. Rows are inserted individually (not via
+    executemany) because the caller needs each new row ID back.
+
+    Args:
+        rows: (name, description, difficulty) tuples
+        deps: Optional mapping from row index to the row indices that
+            entry depends on
+
+    Returns:
+        List[int]: IDs of the created chunks, in input order
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    chunk_ids = []
+    for name, description, difficulty in rows:
+        cursor.execute(_SQL_INSERT_CHUNK, (name, description, difficulty))
+        chunk_ids.append(cursor.lastrowid)
+
+    if deps:
+        # Same cycle guard as add_dependencies; edges inserted earlier
+        # in this transaction are visible to the reachability check
+        for row_idx, dep_idxs in deps.items():
+            for dep_idx in dep_idxs:
+                chunk_id, dep_id = chunk_ids[row_idx], chunk_ids[dep_idx]
+                if cursor.execute(_SQL_WOULD_CYCLE, (dep_id, chunk_id)).fetchone() is None:
+                    cursor.execute(_SQL_INSERT_DEP, (chunk_id, dep_id))
+
+    conn.commit()
+
+    return chunk_ids
+
+
 def get_all_chunks() -> List[Chunk]:
     """Get all chunks from the database.
-    
+
     Returns:
         List[Chunk]: List of all chunks
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute("SELECT * FROM chunks ORDER BY created_at DESC")
-    rows = cursor.fetchall()
-    conn.close()
-    
-    chunks = []
-    for row in rows:
-        chunk = Chunk(
-            id=row["id"],
-            name=row["name"],
-            description=row["description"],
-            difficulty=row["difficulty"],
-            completed=bool(row["completed"]),
-            created_at=datetime.fromisoformat(row["created_at"]) if row["created_at"] else None,
-            completed_at=datetime.fromisoformat(row["completed_at"]) if row["completed_at"] else None
-        )
-        chunks.append(chunk)
-    
-    return chunks
+    return list(iter_all_chunks())
 
 
 def get_chunk_by_id(chunk_id: int) -> Optional[Chunk]:
     """Get a specific chunk by ID.
-    
+
     Args:
         chunk_id: ID of the chunk
-        
+
     Returns:
         Optional[Chunk]: The chunk if found, None otherwise
     """
     conn = get_connection()
     cursor = conn.cursor()
-    
-    cursor.execute("SELECT * FROM chunks WHERE id = ?", (chunk_id,))
+
+    cursor.execute(_SQL_SELECT_BY_ID, (chunk_id,))
     row = cursor.fetchone()
-    conn.close()
-    
+
     if not row:
         return None
-    
-    return Chunk(
-        id=row["id"],
-        name=row["name"],
-        description=row["description"],
-        difficulty=row["difficulty"],
-        completed=bool(row["completed"]),
-        created_at=datetime.fromisoformat(row["created_at"]) if row["created_at"] else None,
-        completed_at=datetime.fromisoformat(row["completed_at"]) if row["completed_at"] else None
-    )
+
+    return _row_to_chunk(row)
 
 
 def complete_chunk(chunk_id: int) -> bool:
     """Mark a chunk as completed.
-    
+
     Args:
         chunk_id: ID of the chunk to complete
-        
+
     Returns:
         bool: True if successful, False if chunk not found
     """
     conn = get_connection()
     cursor = conn.cursor()
-    
-    cursor.execute(
-        "UPDATE chunks SET completed = 1, completed_at = ? WHERE id = ?",
-        (datetime.now().isoformat(), chunk_id)
-    )
-    
+
+    cursor.execute(_SQL_COMPLETE, (chunk_id,))
+
     rows_affected = cursor.rowcount
     conn.commit()
-    conn.close()
-    
+
     return rows_affected > 0
 
 
+def try_complete_chunk(chunk_id: int) -> Optional[Tuple[str, bool, List[Chunk]]]:
+    """Atomically complete a chunk if its dependencies are met.
+
+    The UPDATE re-checks the dependency condition itself and uses
+    RETURNING, so the happy path is a single statement with no window
+    between check and write. Extra queries run only when the update
+    did not apply, to report why.
+
+    Args:
+        chunk_id: ID of the chunk to complete
+
+    Returns:
+        Optional[Tuple[str, bool, List[Chunk]]]: None if the chunk does
+        not exist; otherwise (name, was_already_completed,
+        incomplete_deps). The chunk was completed exactly when
+        was_already_completed is False and incomplete_deps is empty.
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    cursor.execute(_SQL_COMPLETE_GUARDED, (chunk_id,))
+    row = cursor.fetchone()
+    conn.commit()
+
+    if row is not None:
+        return row["name"], False, []
+
+    # The update didn't apply: missing chunk, already done, or blocked
+    cursor.execute(_SQL_SELECT_BY_ID, (chunk_id,))
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    if row["completed"]:
+        return row["name"], True, []
+
+    incomplete = [d for d in get_chunk_dependencies(chunk_id) if not d.completed]
+    return row["name"], False, incomplete
+
+
 def add_dependency(chunk_id: int, depends_on_chunk_id: int) -> bool:
     """Add a dependency between two chunks.
-    
+
     Args:
         chunk_id: The chunk that has the dependency
         depends_on_chunk_id: The chunk that must be completed first
-        
+
     Returns:
         bool: True if successful, False otherwise
     """
+    return depends_on_chunk_id in add_dependencies(chunk_id, [depends_on_chunk_id])
+
+
+def add_dependencies(chunk_id: int, dep_ids: List[int]) -> List[int]:
+    """Add multiple dependencies for a chunk in a single transaction.
+
+    Uses executemany with a single commit, so N dependencies cost one
+    fsync instead of N.
+
+    Args:
+        chunk_id: The chunk that has the dependencies
+        dep_ids: IDs of the chunks that must be completed first
+
+    Returns:
+        List[int]: The dependency IDs that are now recorded for the chunk
+    """
+    if not dep_ids:
+        return []
+
     conn = get_connection()
     cursor = conn.cursor()
-    
-    try:
-        cursor.execute(
-            "INSERT INTO dependencies (chunk_id, depends_on_chunk_id) VALUES (?, ?)",
-            (chunk_id, depends_on_chunk_id)
-        )
-        conn.commit()
-        conn.close()
-        return True
-    except sqlite3.IntegrityError:
-        conn.close()
-        return False
+
+    # INSERT OR IGNORE only covers UNIQUE conflicts — foreign key
+    # violations still raise and would abort the whole batch mid-
+    # transaction — so drop IDs that don't name an existing chunk first
+    placeholders = ", ".join("?" for _ in dep_ids)
+    cursor.execute(
+        f"SELECT id FROM chunks WHERE id IN ({placeholders}, ?)",
+        (*dep_ids, chunk_id)
+    )
+    existing = {row["id"] for row in cursor.fetchall()}
+    if chunk_id not in existing:
+        return []
+
+    # Refuse dependencies that would create a cycle: if a target already
+    # reaches this chunk through existing dependencies, the new edge
+    # would close a loop (this also catches self-dependencies). Every
+    # new edge starts at chunk_id, so the batch can't form cycles among
+    # its own entries.
+    valid = [
+        dep_id for dep_id in dep_ids
+        if dep_id in existing
+        and cursor.execute(_SQL_WOULD_CYCLE, (dep_id, chunk_id)).fetchone() is None
+    ]
+
+    cursor.executemany(_SQL_INSERT_DEP, [(chunk_id, dep_id) for dep_id in valid])
+
+    # INSERT OR IGNORE skips duplicates, so report what is actually
+    # recorded for the requested IDs
+    cursor.execute(
+        f"SELECT depends_on_chunk_id FROM dependencies "
+        f"WHERE chunk_id = ? AND depends_on_chunk_id IN ({placeholders})",
+        (chunk_id, *dep_ids)
+    )
+    added = [row["depends_on_chunk_id"] for row in cursor.fetchall()]
+
+    conn.commit()
+
+    return added
 
 
 def get_chunk_dependencies(chunk_id: int) -> List[Chunk]:
     """Get all chunks that a given chunk depends on.
-    
+
     Args:
         chunk_id: ID of the chunk
-        
+
     Returns:
         List[Chunk]: List of dependency chunks
     """
     conn = get_connection()
     cursor = conn.cursor()
-    
-    cursor.execute("""
-        SELECT c.* FROM chunks c
-        JOIN dependencies d ON c.id = d.depends_on_chunk_id
-        WHERE d.chunk_id = ?
-    """, (chunk_id,))
-    
+
+    cursor.execute(_SQL_SELECT_DEPS, (chunk_id,))
     rows = cursor.fetchall()
-    conn.close()
-    
+
+    return [_row_to_chunk(row) for row in rows]
+
+
+def get_all_chunks_with_deps() -> Tuple[List[Chunk], Dict[int, List[int]]]:
+    """Get all chunks along with their dependency IDs in a single query.
+
+    Avoids the N+1 pattern of one get_chunk_dependencies call per chunk
+    by LEFT JOINing dependencies and grouping in Python.
+
+    Returns:
+        Tuple[List[Chunk], Dict[int, List[int]]]: All chunks (newest first)
+        and a mapping from chunk ID to the IDs it depends on
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    cursor.execute(_SQL_SELECT_ALL_WITH_DEPS)
+    rows = cursor.fetchall()
+
     chunks = []
+    deps: Dict[int, List[int]] = defaultdict(list)
+    seen = set()
     for row in rows:
-        chunk = Chunk(
-            id=row["id"],
-            name=row["name"],
-            description=row["description"],
-            difficulty=row["difficulty"],
-            completed=bool(row["completed"]),
-            created_at=datetime.fromisoformat(row["created_at"]) if row["created_at"] else None,
-            completed_at=datetime.fromisoformat(row["completed_at"]) if row["completed_at"] else None
+        if row["id"] not in seen:
+            seen.add(row["id"])
+            chunks.append(_row_to_chunk(row))
+        if row["dep_id"] is not None:
+            deps[row["id"]].append(row["dep_id"])
+
+    return chunks, deps
+
+
+def get_next_chunk_with_deps() -> Tuple[Optional[Chunk], List[Chunk]]:
+    """Get the next available chunk and its dependencies in one query.
+
+    Same selection as get_next_available_chunk, but the picked chunk is
+    joined against its dependencies via a CTE so the CLI doesn't need a
+    second round-trip for display.
+
+    Returns:
+        Tuple[Optional[Chunk], List[Chunk]]: Next available chunk (or None)
+        and the chunks it depends on
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    cursor.execute(_SQL_NEXT_WITH_DEPS)
+    rows = cursor.fetchall()
+
+    if not rows:
+        return None, []
+
+    row = rows[0]
+    chunk = _row_to_chunk(row)
+
+    deps = [
+        Chunk(
+            id=r["dep_id"],
+            name=r["dep_name"],
+            difficulty=r["dep_difficulty"],
+            completed=bool(r["dep_completed"])
         )
-        chunks.append(chunk)
-    
-    return chunks
+        for r in rows
+        if r["dep_id"] is not None
+    ]
+
+    return chunk, deps
+
+
+def get_next_available_chunks(limit: int = 5) -> List[Chunk]:
+    """Get the chunks that can be worked on right now.
+
+    Every returned chunk has all of its dependencies completed, so none
+    of them depends on another — they can be tackled in any order, or
+    in parallel.
+
+    Args:
+        limit: Maximum number of chunks to return
+
+    Returns:
+        List[Chunk]: Available chunks, easiest and oldest first
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    cursor.execute(_SQL_AVAILABLE_BATCH, (limit,))
+    rows = cursor.fetchall()
+
+    return [_row_to_chunk(row) for row in rows]
 
 
 def get_next_available_chunk() -> Optional[Chunk]:
     """Get the next chunk that can be worked on.
-    
+
     Returns a chunk that:
     - Is not completed
     - Has all dependencies completed (or has no dependencies)
-    
+
     Returns:
         Optional[Chunk]: Next available chunk, or None if none available
     """
     conn = get_connection()
     cursor = conn.cursor()
-    
+
     # Find chunks that are incomplete and have all dependencies met
-    cursor.execute("""
-        SELECT c.* FROM chunks c
-        WHERE c.completed = 0
-        AND NOT EXISTS (
-            SELECT 1 FROM dependencies d
-            JOIN chunks dep ON d.depends_on_chunk_id = dep.id
-            WHERE d.chunk_id = c.id AND dep.completed = 0
-        )
-        ORDER BY c.difficulty ASC, c.created_at ASC
-        LIMIT 1
-    """)
-    
+    cursor.execute(_SQL_NEXT)
     row = cursor.fetchone()
-    conn.close()
-    
+
     if not row:
         return None
-    
-    return Chunk(
-        id=row["id"],
-        name=row["name"],
-        description=row["description"],
-        difficulty=row["difficulty"],
-        completed=bool(row["completed"]),
-        created_at=datetime.fromisoformat(row["created_at"]) if row["created_at"] else None,
-        completed_at=datetime.fromisoformat(row["completed_at"]) if row["completed_at"] else None
-    )
+
+    return _row_to_chunk(row)
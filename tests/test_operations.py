@@ -92,3 +92,149 @@ def test_get_next_available_chunk(test_db):
     next_chunk = operations.get_next_available_chunk()
     assert next_chunk is not None
     assert next_chunk.id == chunk2_id
+
+
+def test_get_all_chunks_with_deps(test_db):
+    """Test fetching all chunks and their dependency IDs in one query."""
+    chunk1_id = operations.create_chunk("Learn Pandas", "Learn pandas basics", 2)
+    chunk2_id = operations.create_chunk("Build ML Model", "Create a simple model", 4)
+    operations.add_dependency(chunk2_id, chunk1_id)
+    
+    chunks, dep_map = operations.get_all_chunks_with_deps()
+    assert len(chunks) == 2
+    assert dep_map[chunk2_id] == [chunk1_id]
+    assert chunk1_id not in dep_map
+
+
+def test_get_next_chunk_with_deps(test_db):
+    """Test fetching the next chunk and its dependencies together."""
+    chunk1_id = operations.create_chunk("Learn Pandas", "Learn pandas basics", 2)
+    chunk2_id = operations.create_chunk("Build ML Model", "Create a simple model", 4)
+    operations.add_dependency(chunk2_id, chunk1_id)
+    operations.complete_chunk(chunk1_id)
+    
+    next_chunk, deps = operations.get_next_chunk_with_deps()
+    assert next_chunk is not None
+    assert next_chunk.id == chunk2_id
+    assert len(deps) == 1
+    assert deps[0].id == chunk1_id
+    assert deps[0].completed is True
+
+
+def test_add_dependencies_batch(test_db):
+    """Test adding several dependencies in one call."""
+    chunk1_id = operations.create_chunk("Learn NumPy", "Learn numpy basics", 2)
+    chunk2_id = operations.create_chunk("Learn Pandas", "Learn pandas basics", 2)
+    chunk3_id = operations.create_chunk("Build ML Model", "Create a simple model", 4)
+    
+    added = operations.add_dependencies(chunk3_id, [chunk1_id, chunk2_id])
+    assert sorted(added) == sorted([chunk1_id, chunk2_id])
+    
+    deps = operations.get_chunk_dependencies(chunk3_id)
+    assert len(deps) == 2
+
+
+def test_try_complete_chunk(test_db):
+    """Test the atomic complete with dependency checking."""
+    chunk1_id = operations.create_chunk("Learn Pandas", "Learn pandas basics", 2)
+    chunk2_id = operations.create_chunk("Build ML Model", "Create a simple model", 4)
+    operations.add_dependency(chunk2_id, chunk1_id)
+    
+    # Missing chunk
+    assert operations.try_complete_chunk(9999) is None
+    
+    # Blocked by an incomplete dependency
+    name, already, incomplete = operations.try_complete_chunk(chunk2_id)
+    assert name == "Build ML Model"
+    assert already is False
+    assert [d.id for d in incomplete] == [chunk1_id]
+    
+    # Dependency-free chunk completes in one shot
+    name, already, incomplete = operations.try_complete_chunk(chunk1_id)
+    assert (name, already, incomplete) == ("Learn Pandas", False, [])
+    
+    # Completing again reports already-completed
+    name, already, incomplete = operations.try_complete_chunk(chunk1_id)
+    assert already is True
+    
+    # Now the dependent chunk can complete
+    name, already, incomplete = operations.try_complete_chunk(chunk2_id)
+    assert (already, incomplete) == (False, [])
+    assert operations.get_chunk_by_id(chunk2_id).completed is True
+
+
+def test_add_dependency_rejects_cycles(test_db):
+    """Test that dependencies forming a cycle are refused."""
+    chunk1_id = operations.create_chunk("Learn NumPy", "Learn numpy basics", 2)
+    chunk2_id = operations.create_chunk("Learn Pandas", "Learn pandas basics", 2)
+    chunk3_id = operations.create_chunk("Build ML Model", "Create a simple model", 4)
+    
+    assert operations.add_dependency(chunk2_id, chunk1_id) is True
+    assert operations.add_dependency(chunk3_id, chunk2_id) is True
+    
+    # Closing the loop (1 -> 3 while 3 -> 2 -> 1 exists) is refused
+    assert operations.add_dependency(chunk1_id, chunk3_id) is False
+    assert operations.get_chunk_dependencies(chunk1_id) == []
+    
+    # A chunk can't depend on itself
+    assert operations.add_dependency(chunk1_id, chunk1_id) is False
+
+
+def test_get_next_available_chunks(test_db):
+    """Test getting the batch of currently unblocked chunks."""
+    chunk1_id = operations.create_chunk("Learn NumPy", "Learn numpy basics", 1)
+    chunk2_id = operations.create_chunk("Learn Pandas", "Learn pandas basics", 2)
+    chunk3_id = operations.create_chunk("Build ML Model", "Create a simple model", 4)
+    operations.add_dependency(chunk3_id, chunk1_id)
+    operations.add_dependency(chunk3_id, chunk2_id)
+    
+    # Both leaf chunks are available; the blocked one is not
+    available = operations.get_next_available_chunks()
+    assert [c.id for c in available] == [chunk1_id, chunk2_id]
+    
+    # The limit is respected
+    available = operations.get_next_available_chunks(limit=1)
+    assert [c.id for c in available] == [chunk1_id]
+
+
+def test_create_chunks_bulk(test_db):
+    """Test creating several chunks in one transaction."""
+    chunk_ids = operations.create_chunks_bulk([
+        ("Learn NumPy", "Learn numpy basics", 1),
+        ("Learn Pandas", "Learn pandas basics", 2),
+    ])
+    assert len(chunk_ids) == 2
+    
+    chunks = operations.get_all_chunks()
+    assert len(chunks) == 2
+    assert operations.get_chunk_by_id(chunk_ids[0]).name == "Learn NumPy"
+
+
+def test_add_dependencies_unknown_ids(test_db):
+    """Test that unknown chunk IDs are reported as failed, not raised."""
+    chunk1_id = operations.create_chunk("Learn Pandas", "Learn pandas basics", 2)
+    chunk2_id = operations.create_chunk("Build ML Model", "Create a simple model", 4)
+    
+    # Unknown target is dropped; the valid one still lands
+    added = operations.add_dependencies(chunk2_id, [chunk1_id, 9999])
+    assert added == [chunk1_id]
+    assert operations.add_dependency(chunk2_id, 9999) is False
+    
+    # Unknown dependent chunk adds nothing
+    assert operations.add_dependencies(9999, [chunk1_id]) == []
+
+
+def test_create_chunks_bulk_with_deps(test_db):
+    """Test that bulk creation wires up dependencies between entries."""
+    chunk_ids = operations.create_chunks_bulk(
+        [
+            ("Learn NumPy", "Learn numpy basics", 1),
+            ("Learn Pandas", "Learn pandas basics", 2),
+            ("Build ML Model", "Create a simple model", 4),
+        ],
+        deps={2: [0, 1]},
+    )
+    
+    deps = operations.get_chunk_dependencies(chunk_ids[2])
+    assert sorted(d.id for d in deps) == sorted(chunk_ids[:2])
+    assert operations.get_chunk_dependencies(chunk_ids[0]) == []